@@ -12,8 +12,8 @@ Introduction
 Entry point for the Ethereum specification.
 """
 
-from dataclasses import dataclass
-from typing import List, Tuple
+from dataclasses import dataclass, field
+from typing import Dict, List, Tuple
 
 from .. import crypto
 from ..base_types import U256, Uint
@@ -49,6 +49,15 @@ class BlockChain:
 
     blocks: List[Block]
     state: State
+    headers_by_hash: Dict[Hash32, Header] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        """
+        Index the headers of the blocks the chain was created with.
+        """
+        for block in self.blocks:
+            block_hash = compute_header_hash(block.header)
+            self.headers_by_hash[block_hash] = block.header
 
 
 def state_transition(chain: BlockChain, block: Block) -> None:
@@ -84,6 +93,7 @@ def state_transition(chain: BlockChain, block: Block) -> None:
     assert trie.root(trie.map_keys(state)) == block.header.state_root
 
     chain.blocks.append(block)
+    chain.headers_by_hash[compute_header_hash(block.header)] = block.header
 
 
 def validate_header(header: Header, parent_header: Header) -> None:
@@ -296,13 +306,13 @@ def calculate_intrinsic_cost(tx: Transaction) -> Uint:
     verified : `eth1spec.base_types.Uint`
         The intrinsic cost of the transaction.
     """
-    data_cost = 0
+    zero_bytes = tx.data.count(0)
+    non_zero_bytes = len(tx.data) - zero_bytes
 
-    for byte in tx.data:
-        if byte == 0:
-            data_cost += TX_DATA_COST_PER_ZERO
-        else:
-            data_cost += TX_DATA_COST_PER_NON_ZERO
+    data_cost = (
+        zero_bytes * TX_DATA_COST_PER_ZERO
+        + non_zero_bytes * TX_DATA_COST_PER_NON_ZERO
+    )
 
     return Uint(TX_BASE_COST + data_cost)
 
@@ -402,10 +412,9 @@ def get_block_header_by_hash(hash: Hash32, chain: BlockChain) -> Header:
     Header : `ethereum.eth_types.Header`
         Block header found by its hash.
     """
-    for block in chain.blocks:
-        if compute_header_hash(block.header) == hash:
-            return block.header
-    else:
+    try:
+        return chain.headers_by_hash[hash]
+    except KeyError:
         raise ValueError(f"Could not find header with hash={hash.hex()}")
 
 
@@ -507,10 +516,9 @@ def print_state(state: State) -> None:
             "nonce": account.nonce,
             "balance": account.balance,
             "code": account.code.hex(),
-            "storage": {},
+            "storage": {
+                k.hex(): hex(v) for (k, v) in account.storage.items()
+            },
         }
 
-        for (k, v) in account.storage.items():
-            nice[address.hex()]["storage"][k.hex()] = hex(v)  # type: ignore
-
     print(nice)
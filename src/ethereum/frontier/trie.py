@@ -14,7 +14,7 @@ The state trie is the structure responsible for storing
 """
 
 from copy import copy
-from typing import Mapping, MutableMapping, Set, Union, cast
+from typing import List, Mapping, MutableMapping, Union, cast
 
 from .. import crypto
 from ..base_types import U256, Bytes, Uint
@@ -94,32 +94,38 @@ def map_keys(
     """
     mapped: MutableMapping[Bytes, Node] = {}
 
-    # skip empty values, these are defined to be omitted from the trie
-    skip: Set[Bytes] = set()
-    for (k, v) in obj.items():
-        if v == b"":
-            skip.add(k)
-
     for (preimage, value) in obj.items():
-        if preimage in skip:
+        # skip empty values, these are defined to be omitted from the trie
+        if value == b"":
             continue
 
         # "secure" tries hash keys once before construction
         key = crypto.keccak256(preimage) if secured else preimage
+        mapped[bytes_to_nibble_list(key)] = value
 
-        nibble_list = bytearray(2 * len(key))
-        for i in range(2 * len(key)):
-            byte_idx = i // 2
-            if i % 2 == 0:
-                # get upper nibble
-                nibble_list[i] = (key[byte_idx] & 0xF0) >> 4
-            else:
-                # get lower nibble
-                nibble_list[i] = key[byte_idx] & 0x0F
+    return mapped
 
-        mapped[Bytes(nibble_list)] = value
 
-    return mapped
+def bytes_to_nibble_list(bytes_: Bytes) -> Bytes:
+    """
+    Converts a `Bytes` into a sequence of nibbles (bytes with value < 16).
+
+    Parameters
+    ----------
+    bytes_ :
+        The `Bytes` to convert.
+
+    Returns
+    -------
+    nibble_list : `eth1spec.base_types.Bytes`
+        The `Bytes` in nibble-list format.
+    """
+    nibble_list = bytearray(2 * len(bytes_))
+    for byte_index, byte in enumerate(bytes_):
+        # upper nibble, then lower nibble
+        nibble_list[byte_index * 2] = (byte & 0xF0) >> 4
+        nibble_list[byte_index * 2 + 1] = byte & 0x0F
+    return Bytes(nibble_list)
 
 
 def encode_leaf(leaf: Node) -> rlp.RLP:
@@ -246,19 +252,9 @@ def patricialize(obj: Mapping[Bytes, Node], i: Uint) -> rlp.RLP:
         return (nibble_list_to_compact(key[i:j], False), child)
 
     # otherwise branch node
-    def build_branch(j: int) -> rlp.RLP:
-        branch = {}
-        skip = {}
-        for (k, v) in obj.items():
-            if len(k) <= i:
-                skip[k] = True
-            if k in skip:
-                continue
-            if k[i] == j:
-                branch[k] = v
-
-        return node_cap(branch, i + 1)
-
+    branches: List[MutableMapping[Bytes, Node]] = []
+    for _ in range(16):
+        branches.append({})
     value: Bytes = b""
     for key in obj:
         if len(key) == i:
@@ -266,6 +262,7 @@ def patricialize(obj: Mapping[Bytes, Node], i: Uint) -> rlp.RLP:
             if isinstance(obj[key], (Account, Receipt, Uint)):
                 raise TypeError()
             value = cast(Bytes, obj[key])
-            break
+        else:
+            branches[key[i]][key] = obj[key]
 
-    return [build_branch(k) for k in range(16)] + [value]
+    return [node_cap(branches[k], i + 1) for k in range(16)] + [value]
@@ -1,5 +1,5 @@
 import json
-import os
+from pathlib import Path
 from typing import Any, List, cast
 
 from ethereum.base_types import U256
@@ -35,8 +35,7 @@ def load_test(path: str) -> Any:
     with open(path) as f:
         test = json.load(f)
 
-    name = os.path.splitext(os.path.basename(path))[0]
-    testname = name + "_Frontier"
+    testname = Path(path).stem + "_Frontier"
 
     if testname not in test:
         print("test not found")
@@ -68,7 +67,6 @@ def run_test(path: str) -> None:
     )
 
     pre_state = json_to_state(test.get("pre"))
-    expected_post_state = json_to_state(test.get("postState"))
 
     chain = BlockChain(
         blocks=[genesis],
@@ -78,13 +76,12 @@ def run_test(path: str) -> None:
     block_obj = None
     for block in test.get("blocks"):
         header = json_to_header(block.get("blockHeader"))
-        txs: List[Transaction] = [
-            json_to_tx(tx_json) for tx_json in block.get("transactions")
-        ]
-        ommers: List[Header] = [
-            json_to_header(ommer_json)
-            for ommer_json in block.get("uncleHeaders")
-        ]
+        txs: List[Transaction] = list(
+            map(json_to_tx, block.get("transactions"))
+        )
+        ommers: List[Header] = list(
+            map(json_to_header, block.get("uncleHeaders"))
+        )
 
         assert rlp_hash(header) == hex2bytes(block["blockHeader"]["hash"])
         block_obj = Block(header, txs, ommers)
@@ -95,6 +92,7 @@ def run_test(path: str) -> None:
     last_block_hash = rlp_hash(chain.blocks[-1].header)
     assert last_block_hash == hex2bytes(test["lastblockhash"])
 
+    expected_post_state = json_to_state(test.get("postState"))
     assert chain.state == expected_post_state
 
 
@@ -133,20 +131,15 @@ def json_to_tx(raw: Any) -> Transaction:
 
 
 def json_to_state(raw: Any) -> State:
-    state = {}
-    for (addr, acc_state) in raw.items():
-        account = Account(
+    return {
+        hex2address(addr): Account(
             nonce=hex2uint(acc_state.get("nonce", "0x0")),
             balance=hex2uint(acc_state.get("balance", "0x0")),
             code=hex2bytes(acc_state.get("code", "")),
-            storage={},
+            storage={
+                hex2bytes32(k): U256.from_be_bytes(hex2bytes32(v))
+                for (k, v) in acc_state.get("storage", {}).items()
+            },
         )
-
-        for (k, v) in acc_state.get("storage", {}).items():
-            account.storage[hex2bytes32(k)] = U256.from_be_bytes(
-                hex2bytes32(v)
-            )
-
-        state[hex2address(addr)] = account
-
-    return state
+        for (addr, acc_state) in raw.items()
+    }